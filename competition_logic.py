@@ -1,9 +1,9 @@
-from collections import Counter
-from typing import List, Tuple
+import logging
+from typing import Dict, List, Optional, Tuple
 
 # Import core components and utilities
 from simulation_core import Participant, Stage, ChallengeSimulator
-from utils import setup_logger, competition_counter
+from utils import setup_logger, NULL_LOGGER
 
 
 # ==============================================================================
@@ -12,35 +12,79 @@ from utils import setup_logger, competition_counter
 
 class Competition:
     """Orchestrates the competition simulation, tracks state, and runs evaluations."""
-    def __init__(self, participants: List[Participant], X: float, Y: float, Z: float, C: float, challenge_rand: float, rep_rand: float, verbose: bool = True, log_subdir: str = None):
-        global competition_counter
-        competition_counter += 1
-
+    def __init__(self, participants: List[Participant], X: float, Y: float, Z: float, C: float, challenge_rand: float, rep_rand: float, verbose: bool = True, log_subdir: str = None, competition_id: Optional[int] = None, seed: Optional[int] = None):
         self.participants = participants
+        # Scores are indexed by list position; map ids to positions for the stage point writes
+        self.points: List[float] = [0.0] * len(participants)
+        self._position: Dict[int, int] = {participant.id: i for i, participant in enumerate(participants)}
+        # Rank orders as participant indices: skills never change, final order is cached after the run
+        self._initial_order: List[int] = sorted(range(len(participants)), key=lambda i: participants[i].initial_skill, reverse=True)
+        self._final_order: List[int] | None = None
         self.num_stages = 6
         self.point_config = {'X': X, 'Y': Y, 'Z': Z, 'C': C}
         self.max_stage_points = Y + Z + C  # Max points a single player can earn in a stage
-        self.stage_5_leaderboard: List[Participant] | None = None  # Stores state after Stage 5
+        self._stage5_scores: List[float] | None = None  # Points snapshot after Stage 5 (indexed by position)
+        self._stage5_sixth: float = 0.0  # 6th-ranked score after Stage 5
         self.stage = Stage(X, Y, Z, C)
-        self.simulator = ChallengeSimulator(challenge_rand, rep_rand)
+        self.simulator = ChallengeSimulator(challenge_rand, rep_rand, seed=seed)
         self.verbose = verbose
 
-        log_file_name = f"competition_{competition_counter}_log.txt"
-        self.logger = setup_logger(log_file_name, verbose, log_subdir=log_subdir)
+        # Snake draft positions are fixed, so map each rank to its team index once
+        self._snake_team_index: List[int] = [
+            (i % 3) if (i // 3) % 2 == 0 else 2 - (i % 3)  # Reverse direction every other "row"
+            for i in range(len(participants))
+        ]
+
+        self.attach_logger(log_subdir, competition_id)
 
-        self.logger.info(f"Starting Simulation ({log_file_name})")
-        self.logger.info(f"Points: X={X}, Y={Y}, Z={Z}, C={C}")
-        self.logger.info(f"Randomness: Challenge={challenge_rand}, Rep Selection={rep_rand}\n")
+
+    def attach_logger(self, log_subdir: Optional[str] = None, competition_id: Optional[int] = None):
+        """Points logging for the following runs at a new target and writes its header."""
+        # Only build a log file name (and a file-backed logger) when a file will be written
+        if self.verbose or log_subdir is not None:
+            log_file_name = f"competition_{competition_id}_log.txt" if competition_id is not None else "competition_log.txt"
+            self.logger = setup_logger(log_file_name, self.verbose, log_subdir=log_subdir)
+        else:
+            log_file_name = None
+            self.logger = NULL_LOGGER
+        # Silent runs get the shared null logger; skip building log messages entirely
+        self._log_enabled = self.logger.isEnabledFor(logging.INFO)
+
+        if self._log_enabled:
+            point_config = self.point_config
+            self.logger.info("Starting Simulation (%s)", log_file_name)
+            self.logger.info("Points: X=%s, Y=%s, Z=%s, C=%s", point_config['X'], point_config['Y'], point_config['Z'], point_config['C'])
+            self.logger.info("Randomness: Challenge=%s, Rep Selection=%s\n", self.simulator.challenge_randomness, self.simulator.rep_selection_randomness)
+
+    def reset(self):
+        """Clears all scores so the same Competition (config, draft order, simulator, logger) can run again."""
+        self.points = [0.0] * len(self.participants)
+        self._final_order = None
+        self._stage5_scores = None
+        self._stage5_sixth = 0.0
+        for participant in self.participants:
+            participant.total_points = 0.0
+
+        if self._log_enabled:
+            self.logger.info("--- New Run ---\n")
 
 
     # --- Utility Methods ---
     def get_initial_leaderboard(self) -> List[Participant]:
         """Returns all participants sorted by initial skill."""
-        return sorted(self.participants, key=lambda p: p.initial_skill, reverse=True)
+        participants = self.participants
+        return [participants[i] for i in self._initial_order]
+
+    def get_final_order(self) -> List[int]:
+        """Returns participant indices sorted by current points (stable for ties)."""
+        if self._final_order is not None:
+            return self._final_order
+        return sorted(range(len(self.points)), key=self.points.__getitem__, reverse=True)
 
     def get_final_leaderboard(self) -> List[Participant]:
         """Returns all participants sorted by final total points."""
-        return sorted(self.participants, key=lambda p: p.total_points, reverse=True)
+        participants = self.participants
+        return [participants[i] for i in self.get_final_order()]
 
     def determine_teams(self, stage_number: int) -> List[List[Participant]]:
         """Forms teams using a snake draft based on current standing."""
@@ -50,83 +94,78 @@ class Competition:
             sorted_participants = self.get_final_leaderboard()
 
         teams: List[List[Participant]] = [[], [], []]
-        
-        # Snake Draft logic
+
+        # Snake Draft logic (team index per rank is precomputed in __init__)
+        snake_team_index = self._snake_team_index
         for i, participant in enumerate(sorted_participants):
-            team_index = i % 3
-            if (i // 3) % 2 == 1: # Reverse direction every other "row"
-                team_index = 2 - team_index
-            teams[team_index].append(participant)
-            
+            teams[snake_team_index[i]].append(participant)
+
         return teams
 
     # --- Simulation Flow Methods ---
     def simulate_stage(self, stage_number: int):
         """Runs one full stage of the competition."""
-        self.logger.info(f"--- Simulating Stage {stage_number} ---")
+        log_enabled = self._log_enabled
         teams = self.determine_teams(stage_number)
 
-        self.logger.info(f"Teams (based on {'Skill' if stage_number == 1 else 'Points'}):")
-        for i, team in enumerate(teams):
-             self.logger.info(f"  Team {i+1}: {[p.name for p in team]}")
-
-        # Challenge 1
-        winning_team_1 = self.stage.run_challenge_1(teams, self.simulator)
-        self.logger.info(f"Challenge 1 Winner Team (X={self.point_config['X']}): {[p.name for p in winning_team_1]}")
-
-        # Challenge 2
-        winning_team_2 = self.stage.run_challenge_2(teams, self.simulator)
-        self.logger.info(f"Challenge 2 Winner Team (Y={self.point_config['Y']}): {[p.name for p in winning_team_2]}")
-
-        # Challenge 3
-        winner_rep, winner_team_3, all_reps = self.stage.run_challenge_3(teams, self.simulator)
-
-        self.logger.info(f"Challenge 3 Representatives: {[p.name for p in all_reps]}")
-        self.logger.info(f"Challenge 3 Winner Representative (Z={self.point_config['Z']}, C={self.point_config['C']}): {winner_rep.name}")
-        self.logger.info(f"Challenge 3 Winner Team: {[p.name for p in winner_team_3]}")
-
-        self.logger.info("\n--- Current Leaderboard ---")
-        leaderboard = self.get_final_leaderboard()
-        for i, participant in enumerate(leaderboard):
-            self.logger.info(f"{i+1}. {participant.name} (Skill: {participant.initial_skill}): {participant.get_points()} points")
-        self.logger.info("-" * 30 + "\n")
+        if log_enabled:
+            self.logger.info("--- Simulating Stage %d ---", stage_number)
+            self.logger.info("Teams (based on %s):", 'Skill' if stage_number == 1 else 'Points')
+            for i, team in enumerate(teams):
+                self.logger.info("  Team %d: %s", i + 1, [p.name for p in team])
+
+        # All three challenges run in one fused pass over the stage's teams
+        winning_team_1, winning_team_2, winner_rep, winner_team_3, all_reps = self.stage.run_all(teams, self.simulator, self.points, self._position)
+
+        # Publish the stage's scores onto the Participant objects
+        for participant, points in zip(self.participants, self.points):
+            participant.total_points = points
+
+        if log_enabled:
+            self.logger.info("Challenge 1 Winner Team (X=%s): %s", self.point_config['X'], [p.name for p in winning_team_1])
+            self.logger.info("Challenge 2 Winner Team (Y=%s): %s", self.point_config['Y'], [p.name for p in winning_team_2])
+            self.logger.info("Challenge 3 Representatives: %s", [p.name for p in all_reps])
+            self.logger.info("Challenge 3 Winner Representative (Z=%s, C=%s): %s", self.point_config['Z'], self.point_config['C'], winner_rep.name)
+            self.logger.info("Challenge 3 Winner Team: %s", [p.name for p in winner_team_3])
+
+            self.logger.info("\n--- Current Leaderboard ---")
+            participants = self.participants
+            for i, index in enumerate(self.get_final_order()):
+                participant = participants[index]
+                self.logger.info("%d. %s (Skill: %s): %s points", i + 1, participant.name, participant.initial_skill, self.points[index])
+            self.logger.info("-" * 30 + "\n")
 
         if stage_number == 5:
-            # Capture the scores *before* any Stage 6 points are added. 
-            # We copy the total_points from the current list to a static list.
-            current_leaderboard_points = {p.id: p.total_points for p in leaderboard}
-            
-            # Create a static list of Participants with the current score state
-            self.stage_5_leaderboard = [
-                Participant(p.id, p.name, p.initial_skill) 
-                for p in self.participants
-            ]
-            for p in self.stage_5_leaderboard:
-                p.total_points = current_leaderboard_points[p.id]
+            # Capture the scores *before* any Stage 6 points are added.
+            self._stage5_scores = list(self.points)
+            if len(self._stage5_scores) >= 6:
+                # 6th-ranked Stage 5 score
+                self._stage5_sixth = sorted(self._stage5_scores, reverse=True)[5]
 
 
     def run_simulation(self):
         """Runs all stages of the competition and generates the final report."""
+        self._final_order = None
         for stage_number in range(1, self.num_stages + 1):
             self.simulate_stage(stage_number)
 
+        # Rank once; the evaluations and the report all share this order
+        self._final_order = self.get_final_order()
+
         self.generate_final_report()
 
 
     # --- Evaluation Methods ---
     def evaluate_stability(self, top_N: int, target_M: int) -> Tuple[float, int]:
         """Evaluates competitive stability: how many top/bottom initial players remain in the target band."""
-        num_participants = len(self.participants)
-        initial_board = self.get_initial_leaderboard()
-        initial_top_N = initial_board[:top_N]
-        initial_bottom_N = initial_board[num_participants - top_N:]
-        final_board = self.get_final_leaderboard()
+        initial_order = self._initial_order
+        final_order = self.get_final_order()
 
-        final_top_M = set(final_board[:target_M])
-        top_count = sum(1 for p in initial_top_N if p in final_top_M)
+        final_top_M = set(final_order[:target_M])
+        top_count = sum(1 for i in initial_order[:top_N] if i in final_top_M)
 
-        final_bottom_M = set(final_board[num_participants - target_M:])
-        bottom_count = sum(1 for p in initial_bottom_N if p in final_bottom_M)
+        final_bottom_M = set(final_order[len(final_order) - target_M:])
+        bottom_count = sum(1 for i in initial_order[len(initial_order) - top_N:] if i in final_bottom_M)
 
         successful_players = top_count + bottom_count
         total_possible = 2 * top_N
@@ -136,58 +175,38 @@ class Competition:
 
     def evaluate_cut_off_collision(self) -> int:
         """Measures the number of people tied across the 6th and 7th rank."""
-        final_board = self.get_final_leaderboard()
-        num_participants = len(final_board)
-
-        if num_participants < 7:
+        points = self.points
+        if len(points) < 7:
             return 0
 
-        score_6th = final_board[5].total_points
-        score_7th = final_board[6].total_points
+        # Only the 6th and 7th ranked scores matter; read them through the cached final order
+        final_order = self.get_final_order()
+        score_6th = points[final_order[5]]
+        score_7th = points[final_order[6]]
 
         if score_6th > score_7th:
             return 0
 
         # If score_6th == score_7th, a collision exists. Count all participants with this score.
-        collision_score = score_6th
-        score_counts = Counter(p.total_points for p in final_board)
-        collision_size = score_counts[collision_score]
-
-        return collision_size
+        return points.count(score_6th)
 
     def evaluate_final_contenders(self) -> int:
         """Evaluates how many participants can mathematically still finish in the Top 6 after Stage 5."""
-        leaderboard = self.stage_5_leaderboard
-        if not leaderboard or len(leaderboard) < 6:
+        stage_5_scores = self._stage5_scores
+        if not stage_5_scores or len(stage_5_scores) < 6:
             return 0
 
-        max_stage_points = self.max_stage_points
-
-        # 1. Determine the score of the 6th-ranked participant (the target score)
-        score_6th = leaderboard[5].total_points
-
-        contender_count = 0
-
-        # 2. Map participant ID to their Stage 5 score for quick lookup
-        stage_5_score_map = {p.id: p.total_points for p in leaderboard}
-
-        # 3. Check every participant's potential
-        for participant in self.participants:
-            stage_5_score = stage_5_score_map.get(participant.id, 0)
-
-            # Max final score assumes the player wins ALL possible points in Stage 6
-            max_final_score = stage_5_score + max_stage_points
-
-            # Check if they can match or beat the current 6th place score
-            if max_final_score >= score_6th:
-                contender_count += 1
-
-        return contender_count
+        # A participant is a contender if winning ALL possible Stage 6 points
+        # would let them match or beat the 6th-ranked Stage 5 score.
+        threshold = self._stage5_sixth - self.max_stage_points
+        return sum(1 for score in stage_5_scores if score >= threshold)
 
     # --- Reporting Method ---
     def generate_final_report(self):
         """Logs the evaluation metrics and final leaderboard for the completed competition."""
-        
+        if not self._log_enabled:
+            return
+
         # 1. Calculate Metrics (using default criteria N=3, M=6)
         N = 3
         M = 6
@@ -201,16 +220,16 @@ class Competition:
         self.logger.info("       FINAL COMPETITION METRICS     ")
         self.logger.info("===================================")
 
-        self.logger.info(f"1. Stability Score (Top {N}/Bottom {N} in Top {M}/Bottom {M}):")
-        self.logger.info(f"   Score: {stability_score:.2f} ({successful_players} out of {total_possible} players met criteria)")
+        self.logger.info("1. Stability Score (Top %d/Bottom %d in Top %d/Bottom %d):", N, N, M, M)
+        self.logger.info("   Score: %.2f (%d out of %d players met criteria)", stability_score, successful_players, total_possible)
 
         self.logger.info("\n2. Cut-off Collision (6th/7th Rank Tie):")
-        self.logger.info(f"   Collision Group Size: {collision_size}")
+        self.logger.info("   Collision Group Size: %d", collision_size)
         if collision_size > 0:
             self.logger.info("   --> WARNING: Tie across the Top 6 / Bottom 6 cut-off.")
 
         self.logger.info("\n3. Final Stage Contenders (After Stage 5):")
-        self.logger.info(f"   Total Contenders for Top 6: {contender_count} out of {len(self.participants)}")
+        self.logger.info("   Total Contenders for Top 6: %d out of %d", contender_count, len(self.participants))
         self.logger.info("===================================\n")
 
 
@@ -218,5 +237,5 @@ class Competition:
         self.logger.info("\n========== FINAL RESULTS ==========")
         final_leaderboard = self.get_final_leaderboard()
         for i, participant in enumerate(final_leaderboard):
-            self.logger.info(f"{i+1}. {participant.name}: {participant.get_points():.2f} points (Initial Skill: {participant.initial_skill})")
+            self.logger.info("%d. %s: %.2f points (Initial Skill: %s)", i + 1, participant.name, participant.get_points(), participant.initial_skill)
         self.logger.info("===================================\n")
\ No newline at end of file
@@ -1,9 +1,12 @@
 # run_sweep.py
 
 from competition_logic import Competition
-from utils import PARTICIPANT_DATA, generate_fresh_participants, competition_counter
-from typing import Dict, Tuple, List, Any
+from utils import PARTICIPANT_NAMES, PARTICIPANT_SKILL_BY_NAME, generate_fresh_participants
+from typing import Dict, Tuple, List, Any, Optional
 import os
+from functools import partial
+from itertools import product
+from multiprocessing import Pool
 
 
 # ==============================================================================
@@ -21,8 +24,7 @@ def save_detailed_results(results: Dict[str, Any], subdir: str):
     """Saves the detailed aggregated metrics and average leaderboard for one parameter set."""
     
     results_dir = "sweep_results"
-    if not os.path.exists(results_dir):
-        os.makedirs(results_dir)
+    os.makedirs(results_dir, exist_ok=True)  # Safe when several workers race to create it
         
     params = results['params']
     filename = f"RESULTS_C{params['C']}_Z{params['Z']}_X{params['X']}_Y{params['Y']}.txt"
@@ -32,28 +34,32 @@ def save_detailed_results(results: Dict[str, Any], subdir: str):
     log_file_reference = f"simulation_logs/{subdir}/competition_{results['log_id']}_log.txt (Last Run ID)"
 
 
-    with open(filepath, 'w') as f:
-        f.write("========================================================\n")
-        f.write(f"  DETAILED PARAMETER TEST RESULTS: {subdir}  \n")
-        f.write("========================================================\n")
-        f.write(f"Point Configuration (C, Z, X, Y): ({params['C']}, {params['Z']}, {params['X']}, {params['Y']})\n")
-        f.write(f"Randomness: Challenge={CHALLENGE_RAND}, Rep Selection={REP_RAND}\n")
-        f.write(f"Total Competitions Run: {NUM_COMPETITIONS}\n\n")
-
-        f.write("--- OPTIMIZATION METRICS ---\n")
-        f.write(f"1. OPTIMIZATION SCORE: {results['optimization_score']:.4f}\n")
-        f.write("   (Higher is better; 0.0 is minimum acceptable)\n")
-        f.write(f"2. Avg. Stability Score (Target >= 4.0): {results['avg_successful_players_count']:.3f} / 6.0\n")
-        f.write(f"3. Avg. Collision Size (Target <= 3.0): {results['avg_cut_off_collision_size']:.3f}\n")
-        f.write(f"4. Avg. Contenders (Target >= 9.0): {results['avg_contender_count']:.3f}\n\n")
-
-        f.write("--- AVERAGE FINAL LEADERBOARD ---\n")
-        for i, entry in enumerate(results['average_leaderboard']):
-            f.write(f"{i+1:2}. {entry['name']:8}: {entry['avg_score']:7.3f} points (Skill: {entry['initial_skill']})\n")
-        f.write("--------------------------------------------------------\n")
-        
-        # Updated reference to link the detailed log
-        f.write(f"Corresponding Detailed Log File: {log_file_reference}\n") 
+    # Assemble the whole report in memory and write it with a single call
+    lines: List[str] = []
+    lines.append("========================================================\n")
+    lines.append(f"  DETAILED PARAMETER TEST RESULTS: {subdir}  \n")
+    lines.append("========================================================\n")
+    lines.append(f"Point Configuration (C, Z, X, Y): ({params['C']}, {params['Z']}, {params['X']}, {params['Y']})\n")
+    lines.append(f"Randomness: Challenge={CHALLENGE_RAND}, Rep Selection={REP_RAND}\n")
+    lines.append(f"Total Competitions Run: {NUM_COMPETITIONS}\n\n")
+
+    lines.append("--- OPTIMIZATION METRICS ---\n")
+    lines.append(f"1. OPTIMIZATION SCORE: {results['optimization_score']:.4f}\n")
+    lines.append("   (Higher is better; 0.0 is minimum acceptable)\n")
+    lines.append(f"2. Avg. Stability Score (Target >= 4.0): {results['avg_successful_players_count']:.3f} / 6.0\n")
+    lines.append(f"3. Avg. Collision Size (Target <= 3.0): {results['avg_cut_off_collision_size']:.3f}\n")
+    lines.append(f"4. Avg. Contenders (Target >= 9.0): {results['avg_contender_count']:.3f}\n\n")
+
+    lines.append("--- AVERAGE FINAL LEADERBOARD ---\n")
+    for i, entry in enumerate(results['average_leaderboard']):
+        lines.append(f"{i+1:2}. {entry['name']:8}: {entry['avg_score']:7.3f} points (Skill: {entry['initial_skill']})\n")
+    lines.append("--------------------------------------------------------\n")
+    
+    # Updated reference to link the detailed log
+    lines.append(f"Corresponding Detailed Log File: {log_file_reference}\n")
+
+    with open(filepath, 'w', buffering=65536) as f:
+        f.write(''.join(lines))
 
     print(f"   [Report Saved: {filename}]")
 
@@ -64,16 +70,20 @@ def save_detailed_results(results: Dict[str, Any], subdir: str):
 # ==============================================================================
 
 def run_parameter_test(
-    X: int, Y: int, Z: int, C: int,
-    challenge_rand: float, rep_rand: float, num_runs: int
-) -> Dict[str, Any]: 
+    params: Tuple[int, int, int, int],
+    challenge_rand: float, rep_rand: float, num_runs: int, seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """Runs num_runs competitions for one (X, Y, Z, C) combination; picklable for Pool workers.
+    Pass seed to make the combination's results reproducible."""
+    X, Y, Z, C = params
+    print(f"Testing combination: C={C}, Z={Z}, X={X}, Y={Y}")
 
     # Aggregator variables
     total_stability_score = 0.0
     total_collision_size = 0
     total_contender_count = 0
     total_successful_players = 0
-    avg_score_tracker = {name: 0.0 for name, _ in PARTICIPANT_DATA}
+    avg_score_tracker = {name: 0.0 for name in PARTICIPANT_NAMES}
 
     STABILITY_TOP_N = 3
     STABILITY_TARGET_M = 6
@@ -81,15 +91,19 @@ def run_parameter_test(
     # Define the nested log subdirectory name
     log_subdir = f"C{C}_Z{Z}_X{X}_Y{Y}"
 
-    for i in range(1, num_runs + 1):
-        participants = generate_fresh_participants()
+    # One Competition is reused for every run; reset() clears the scores between runs
+    competition = Competition(
+        participants=generate_fresh_participants(), X=float(X), Y=float(Y), Z=float(Z), C=float(C),
+        challenge_rand=challenge_rand, rep_rand=rep_rand, verbose=False, seed=seed
+    )
 
-        # The Competition counter is incremented inside Competition.__init__
-        competition = Competition(
-            participants=participants, X=float(X), Y=float(Y), Z=float(Z), C=float(C),
-            challenge_rand=challenge_rand, rep_rand=rep_rand,
-            verbose=False, log_subdir=log_subdir 
-        )
+    for i in range(1, num_runs + 1):
+        # Only the last run writes a detailed log (it is the one referenced in the reports);
+        # the others run silently with no file I/O. The run index doubles as the log ID.
+        if i > 1:
+            competition.reset()
+        if i == num_runs:
+            competition.attach_logger(log_subdir=log_subdir, competition_id=i)
 
         competition.run_simulation()
 
@@ -124,12 +138,12 @@ def run_parameter_test(
     # Average Leaderboard calculation
     average_leaderboard = sorted([
         {"name": name, "avg_score": total_score / num_runs_f,
-         "initial_skill": next(skill for p_name, skill in PARTICIPANT_DATA if p_name == name)}
+         "initial_skill": PARTICIPANT_SKILL_BY_NAME[name]}
         for name, total_score in avg_score_tracker.items()
     ], key=lambda x: x['avg_score'], reverse=True)
 
-    # competition_counter holds the ID of the last run's log file for this parameter set
-    last_log_id = competition_counter 
+    # The last run's index is the ID of its log file inside log_subdir
+    last_log_id = num_runs
 
     results = {
         "params": {'X': X, 'Y': Y, 'Z': Z, 'C': C},
@@ -165,43 +179,50 @@ def save_sweep_results(all_test_results: List[Dict[str, Any]]):
         reverse=True
     )
 
-    with open(text_file, 'w') as f:
-        f.write("=================================================================================\n")
-        f.write("                       OPTIMIZATION SWEEP LEADERBOARD\n")
-        f.write(f"Parameters: X, Y, Z, C | Runs per combo: {NUM_COMPETITIONS} | Challenge Rand: {CHALLENGE_RAND}\n")
-        f.write("=================================================================================\n")
-        f.write("Rank | Score  | X | Y | Z | C | Stability | Collision | Contenders\n")
-        f.write("-----|--------|---|---|---|---|-----------|-----------|-----------\n")
-
-        for i, result in enumerate(final_leaderboard):
-            params = result['params']
-            f.write(
-                f"{i+1:4} | {result['optimization_score']:<5.3f} | "
-                f"{params['X']:1} | {params['Y']:1} | {params['Z']:1} | {params['C']:1} | "
-                f"{result['avg_successful_players_count']:<9.3f} | "
-                f"{result['avg_cut_off_collision_size']:<9.3f} | "
-                f"{result['avg_contender_count']:<10.3f}\n"
-            )
-
-    with open(csv_file, 'w') as f:
-        # Write CSV Headers
-        f.write("Rank,Optimization_Score,X,Y,Z,C,Avg_Successful_Players,Avg_Collision_Size,Avg_Contender_Count,Log_Subdir,Log_File_ID\n")
+    # Build each report as a single buffer so it is written with one call
+    text_lines: List[str] = []
+    text_lines.append("=================================================================================\n")
+    text_lines.append("                       OPTIMIZATION SWEEP LEADERBOARD\n")
+    text_lines.append(f"Parameters: X, Y, Z, C | Runs per combo: {NUM_COMPETITIONS} | Challenge Rand: {CHALLENGE_RAND}\n")
+    text_lines.append("=================================================================================\n")
+    text_lines.append("Rank | Score  | X | Y | Z | C | Stability | Collision | Contenders\n")
+    text_lines.append("-----|--------|---|---|---|---|-----------|-----------|-----------\n")
+
+    for i, result in enumerate(final_leaderboard):
+        params = result['params']
+        text_lines.append(
+            f"{i+1:4} | {result['optimization_score']:<5.3f} | "
+            f"{params['X']:1} | {params['Y']:1} | {params['Z']:1} | {params['C']:1} | "
+            f"{result['avg_successful_players_count']:<9.3f} | "
+            f"{result['avg_cut_off_collision_size']:<9.3f} | "
+            f"{result['avg_contender_count']:<10.3f}\n"
+        )
+
+    csv_lines: List[str] = []
+    # Write CSV Headers
+    csv_lines.append("Rank,Optimization_Score,X,Y,Z,C,Avg_Successful_Players,Avg_Collision_Size,Avg_Contender_Count,Log_Subdir,Log_File_ID\n")
+    
+    for i, result in enumerate(final_leaderboard):
+        params = result['params']
+        log_subdir = f"C{params['C']}_Z{params['Z']}_X{params['X']}_Y{params['Y']}"
         
-        for i, result in enumerate(final_leaderboard):
-            params = result['params']
-            log_subdir = f"C{params['C']}_Z{params['Z']}_X{params['X']}_Y{params['Y']}"
-            
-            # Write data row
-            f.write(
-                f"{i+1},"
-                f"{result['optimization_score']:.4f},"
-                f"{params['X']},{params['Y']},{params['Z']},{params['C']},"
-                f"{result['avg_successful_players_count']:.4f},"
-                f"{result['avg_cut_off_collision_size']:.4f},"
-                f"{result['avg_contender_count']:.4f},"
-                f"{log_subdir},"
-                f"competition_{result['log_id']}_log.txt\n"
-            )
+        # Write data row
+        csv_lines.append(
+            f"{i+1},"
+            f"{result['optimization_score']:.4f},"
+            f"{params['X']},{params['Y']},{params['Z']},{params['C']},"
+            f"{result['avg_successful_players_count']:.4f},"
+            f"{result['avg_cut_off_collision_size']:.4f},"
+            f"{result['avg_contender_count']:.4f},"
+            f"{log_subdir},"
+            f"competition_{result['log_id']}_log.txt\n"
+        )
+
+    with open(text_file, 'w', buffering=65536) as f:
+        f.write(''.join(text_lines))
+
+    with open(csv_file, 'w', buffering=65536) as f:
+        f.write(''.join(csv_lines))
 
     print("\nOptimization sweep complete. Final leaderboard saved to:\n")
     print(f"  - Text Report: {text_file}")
@@ -219,40 +240,37 @@ def run_optimization_sweep(
     challenge_rand: float, rep_rand: float, num_runs: int
 ):
     """
-    Executes simulations for all valid integer point combinations (C < Z < X < Y).
+    Executes simulations for all valid integer point combinations (Z < X < Y, any C).
     """
 
-    all_test_results = []
-    
     # Print header for progress tracking
     print("Starting Optimization Sweep...")
     print(f"Bounds: C=[{C_LOWER}-{C_HIGHER}], Z=[{Z_LOWER}-{Z_HIGHER}], X=[{X_LOWER}-{X_HIGHER}], Y=[{Y_LOWER}-{Y_HIGHER}]")
     print("-" * 60)
 
-    # Nested loops for all combinations
-    for C in range(C_bounds[0], C_bounds[1] + 1):
-        for Z in range(Z_bounds[0], Z_bounds[1] + 1):
-            #if C >= Z: # Commented this out to allow for C to be greater than Z
-            #    continue 
-
-            for X in range(X_bounds[0], X_bounds[1] + 1):
-                if Z >= X: 
-                    continue 
-
-                for Y in range(Y_bounds[0], Y_bounds[1] + 1):
-                    if X >= Y: 
-                        continue 
-
-                    # Combination is valid: C < Z < X < Y
-                    print(f"Testing combination: C={C}, Z={Z}, X={X}, Y={Y}")
-
-                    # Run the parameter test
-                    results = run_parameter_test(
-                        X=X, Y=Y, Z=Z, C=C,
-                        challenge_rand=challenge_rand, rep_rand=rep_rand, num_runs=num_runs
-                    )
-
-                    all_test_results.append(results)
+    # Enumerate every valid combination up front (C is free relative to Z; only Z < X < Y is enforced)
+    combinations: List[Tuple[int, int, int, int]] = [
+        (X, Y, Z, C)
+        for C, Z, X, Y in product(
+            range(C_bounds[0], C_bounds[1] + 1), range(Z_bounds[0], Z_bounds[1] + 1),
+            range(X_bounds[0], X_bounds[1] + 1), range(Y_bounds[0], Y_bounds[1] + 1)
+        )
+        if Z < X < Y
+    ]
+    total_combinations = len(combinations)
+    print(f"Valid combinations to test: {total_combinations}")
+
+    # Each combination is independent (own simulator RNG, own output files), so run them
+    # across all cores. Results are re-sorted by score when saved, so completion order is irrelevant.
+    test_combination = partial(
+        run_parameter_test,
+        challenge_rand=challenge_rand, rep_rand=rep_rand, num_runs=num_runs
+    )
+    all_test_results = []
+    with Pool() as pool:
+        for completed, results in enumerate(pool.imap_unordered(test_combination, combinations), start=1):
+            all_test_results.append(results)
+            print(f"   [Progress: {completed}/{total_combinations}]")
 
     # Save the final sorted leaderboard to a file
     save_sweep_results(all_test_results)
@@ -1,5 +1,5 @@
 import random
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 
 
 # ==============================================================================
@@ -8,17 +8,14 @@ from typing import List, Dict, Tuple
 
 class Participant:
     """Represents a single competitor."""
+    __slots__ = ('id', 'name', 'initial_skill', 'total_points')
+
     def __init__(self, id: int, name: str, initial_skill: float):
         self.id = id
         self.name = name
         self.initial_skill = initial_skill
-        self.total_points = 0.0 # Use float for points consistency
-
-    def add_points(self, points: float):
-        """Updates the participant's score, enforcing the zero-point floor."""
-        self.total_points += points
-        if self.total_points < 0:
-            self.total_points = 0.0
+        # Competition.points holds the live scores; this copy is refreshed after each stage
+        self.total_points = 0.0
 
     def get_points(self) -> float:
         return self.total_points
@@ -28,55 +25,47 @@ class Participant:
         return self.name
 
 
+# ==============================================================================
+# SCORING KERNEL
+# ==============================================================================
+
+def _weighted_argmax(values: List[float], randomness: float, uniform: Callable[[], float]) -> int:
+    """Returns the index of the highest (1 - r) * value + r * U(0, max(values)) score."""
+    max_value = max(values)
+    skill_weight = 1 - randomness
+
+    best_index = 0
+    best_score = float('-inf')
+    for index, value in enumerate(values):
+        score = skill_weight * value + randomness * (max_value * uniform())
+        if score > best_score:
+            best_index, best_score = index, score
+    return best_index
+
+
 class ChallengeSimulator:
     """Handles logic for determining challenge winners based on skill and randomness."""
-    def __init__(self, challenge_rand: float, rep_rand: float):
+    def __init__(self, challenge_rand: float, rep_rand: float, seed: Optional[int] = None):
         self.challenge_randomness = challenge_rand
         self.rep_selection_randomness = rep_rand
+        # Dedicated generator: avoids the shared module-level state and allows seeded runs
+        self.rng = random.Random(seed)
 
-    def determine_team_winner(self, teams: List[List[Participant]]) -> List[Participant]:
-        """Calculates team scores and returns the winning team."""
-        team_scores: List[Tuple[float, List[Participant]]] = []
-        # Calculate max skill sum to scale the random factor appropriately
-        max_skill_sum = max(sum(p.initial_skill for p in team) for team in teams) if teams else 0.0
-
-        for team in teams:
-            team_skill_sum = sum(p.initial_skill for p in team)
-            random_component = random.uniform(0.0, max_skill_sum)
-            # Score = (Skill Weighted) + (Random Weighted)
-            team_score = (1 - self.challenge_randomness) * team_skill_sum + self.challenge_randomness * random_component
-            team_scores.append((team_score, team))
-
-        # The team with the highest score wins
-        winning_team = max(team_scores, key=lambda item: item[0])[1]
-        return winning_team
-
-    def determine_individual_winner(self, representatives: List[Participant]) -> Participant:
-        """Calculates individual scores and returns the winning representative."""
-        individual_scores: List[Tuple[float, Participant]] = []
-        max_skill = max(p.initial_skill for p in representatives) if representatives else 0.0
-
-        for rep in representatives:
-            random_component = random.uniform(0.0, max_skill)
-            # Score = (Skill Weighted) + (Random Weighted)
-            individual_score = (1 - self.challenge_randomness) * rep.initial_skill + self.challenge_randomness * random_component
-            individual_scores.append((individual_score, rep))
-
-        winning_rep = max(individual_scores, key=lambda item: item[0])[1]
-        return winning_rep
+    def determine_team_winner(self, team_skill_sums: List[float]) -> int:
+        """Calculates team scores from precomputed skill sums and returns the winning team's index."""
+        if not team_skill_sums:
+            return 0
+        return _weighted_argmax(team_skill_sums, self.challenge_randomness, self.rng.random)
+
+    def determine_individual_winner(self, representatives: List[Participant]) -> int:
+        """Calculates individual scores and returns the winning representative's index."""
+        skills = [rep.initial_skill for rep in representatives]
+        return _weighted_argmax(skills, self.challenge_randomness, self.rng.random)
 
     def select_team_representative(self, team: List[Participant]) -> Participant:
         """Selects one representative from a team based on skill and selection randomness."""
-        selection_scores: List[Tuple[float, Participant]] = []
-        max_skill = max(p.initial_skill for p in team) if team else 0.0
-
-        for member in team:
-            random_component = random.uniform(0.0, max_skill)
-            selection_score = (1 - self.rep_selection_randomness) * member.initial_skill + self.rep_selection_randomness * random_component
-            selection_scores.append((selection_score, member))
-
-        chosen_rep = max(selection_scores, key=lambda item: item[0])[1]
-        return chosen_rep
+        skills = [member.initial_skill for member in team]
+        return team[_weighted_argmax(skills, self.rep_selection_randomness, self.rng.random)]
 
 
 class Stage:
@@ -84,41 +73,47 @@ class Stage:
     def __init__(self, X: float, Y: float, Z: float, C: float):
         self.point_values: Dict[str, float] = {'X': X, 'Y': Y, 'Z': Z, 'C': C}
 
-    def run_challenge_1(self, teams: List[List[Participant]], simulator: ChallengeSimulator) -> List[Participant]:
-        """Team Challenge 1 (X points)."""
-        winning_team = simulator.determine_team_winner(teams)
-        for participant in winning_team:
-            participant.add_points(self.point_values['X'])
-        return winning_team
-
-    def run_challenge_2(self, teams: List[List[Participant]], simulator: ChallengeSimulator) -> List[Participant]:
-        """Team Challenge 2 (Y points)."""
-        winning_team = simulator.determine_team_winner(teams)
-        for participant in winning_team:
-            participant.add_points(self.point_values['Y'])
-        return winning_team
-
-    def run_challenge_3(self, teams: List[List[Participant]], simulator: ChallengeSimulator) -> Tuple[Participant, List[Participant], List[Participant]]:
-        """Individual Challenge 3 (Z and C points)."""
+    @staticmethod
+    def get_team_skill_sums(teams: List[List[Participant]]) -> List[float]:
+        """Sums initial skill per team; computed once per stage and shared by both team challenges."""
+        return [sum(p.initial_skill for p in team) for team in teams]
+
+    def run_all(self, teams: List[List[Participant]], simulator: ChallengeSimulator, points: List[float], position: Dict[int, int]) -> Tuple[List[Participant], List[Participant], Participant, List[Participant], List[Participant]]:
+        """Runs all three challenges of the stage and applies the resulting point changes in one pass.
+
+        ``position`` maps each participant id to its index in ``points``.
+        """
+        point_values = self.point_values
+        team_skill_sums = self.get_team_skill_sums(teams)
+
+        # Challenges 1 and 2: Team Challenges (X and Y points)
+        winning_team_1 = teams[simulator.determine_team_winner(team_skill_sums)]
+        winning_team_2 = teams[simulator.determine_team_winner(team_skill_sums)]
+
+        # Challenge 3: Individual Challenge (Z and C points)
+        # Representatives are picked in team order, so the winner's index is also their team's index
         all_reps = [simulator.select_team_representative(team) for team in teams]
-        winner_rep = simulator.determine_individual_winner(all_reps)
-
-        # Find the winning team based on the representative
-        winner_team = next((team for team in teams if winner_rep in team), [])
-        
-        # Point Distribution:
-        if winner_team:
-            # 1. Team points (Z)
-            for participant in winner_team:
-                participant.add_points(self.point_values['Z'])
-
-            # 2. Individual Winner bonus (C)
-            winner_rep.add_points(self.point_values['C'])
-
-        # 3. Individual Losers penalty (-C)
-        for rep in all_reps:
-            if rep != winner_rep:
-                rep.add_points(-self.point_values['C'])
-
-        # Returns: Winner Rep, Winner Team, All Representatives
-        return winner_rep, winner_team, all_reps
\ No newline at end of file
+        winner_index = simulator.determine_individual_winner(all_reps)
+        winner_rep = all_reps[winner_index]
+        winner_team = teams[winner_index]
+
+        # Point Distribution: awards X, Y, Z and +C are positive and need no floor check.
+        for participant in winning_team_1:
+            points[position[participant.id]] += point_values['X']
+        for participant in winning_team_2:
+            points[position[participant.id]] += point_values['Y']
+        # 1. Team points (Z)
+        for participant in winner_team:
+            points[position[participant.id]] += point_values['Z']
+        # 2. Individual Winner bonus (C)
+        points[position[winner_rep.id]] += point_values['C']
+
+        # 3. Individual Losers penalty (-C): the only change that can breach the zero-point floor
+        for rep_index, rep in enumerate(all_reps):
+            if rep_index != winner_index:
+                rep_position = position[rep.id]
+                total = points[rep_position] - point_values['C']
+                points[rep_position] = total if total > 0.0 else 0.0
+
+        # Returns: Challenge 1 Winner Team, Challenge 2 Winner Team, Winner Rep, Winner Team, All Representatives
+        return winning_team_1, winning_team_2, winner_rep, winner_team, all_reps
@@ -1,6 +1,6 @@
 import logging 
 import os 
-from typing import List
+from typing import Dict, List
 # Note: The Participant class is defined in simulation_core.py, so this import is correct.
 from simulation_core import Participant
 
@@ -15,8 +15,15 @@ PARTICIPANT_DATA: List[tuple[str, float]] = [
     ("Rank_09", 20), ("Rank_10", 10), ("Rank_11", 5), ("Rank_12", 1)
 ]
 
-# Global counter to ensure unique log filenames
-competition_counter: int = 0
+# Lookup tables derived from PARTICIPANT_DATA (index i corresponds to participant id i + 1)
+PARTICIPANT_SKILL_BY_NAME: Dict[str, float] = dict(PARTICIPANT_DATA)
+PARTICIPANT_NAMES: List[str] = [name for name, _ in PARTICIPANT_DATA]
+
+# Shared no-op logger for silent runs (no console output and no log subdirectory)
+NULL_LOGGER = logging.getLogger("simulation.null")
+NULL_LOGGER.addHandler(logging.NullHandler())
+NULL_LOGGER.propagate = False
+NULL_LOGGER.disabled = True
 
 
 # ==============================================================================
@@ -26,9 +33,15 @@ competition_counter: int = 0
 def setup_logger(log_file_name: str, console_output: bool, log_subdir: str = None) -> logging.Logger:
     """
     Sets up a logger and creates nested directory paths if log_subdir is provided.
+    Silent runs (no console output, no log_subdir) get a shared null logger and touch no files.
     """
+    if not console_output and log_subdir is None:
+        return NULL_LOGGER
+
     logger = logging.getLogger(log_file_name)
     logger.setLevel(logging.INFO)
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers = []
     logger.propagate = False 
 
@@ -49,8 +62,7 @@ def setup_logger(log_file_name: str, console_output: bool, log_subdir: str = Non
         # Use the base directory (e.g., for the optimization sweep file)
         log_dir = log_dir_base 
 
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
 
     log_path = os.path.join(log_dir, log_file_name)
     fh = logging.FileHandler(log_path, mode='w')